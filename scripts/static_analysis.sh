@@ -18,6 +18,367 @@ cleanup() {
 }
 trap cleanup EXIT
 
+# 各ツールの検出結果は、1行1件の固定フィールドのTSV（問題レコード）に正規化して扱う
+# フィールド: ファイル, 行, 列, 重要度, メッセージ, ルール名
+# ツールの出力はすべてファイルへ直接書き出し、解析はバイト単位（LC_ALL=C）で1パスで行う
+
+# clang系ツールの診断行 "ファイル:行:列: warning|error|fatal error: メッセージ [ルール名]" の
+# 先頭部分にマッチする正規表現（末尾の " [ルール名]" は省略される場合がある）
+CLANG_DIAG_RE='^[^:]+:[0-9]+:[0-9]+: (warning|error|fatal error): '
+
+# 問題レコード（TSV）の件数を出力
+count_issues() {
+    if [ -f "$1" ]; then
+        wc -l < "$1" | tr -d ' '
+    else
+        echo 0
+    fi
+}
+
+# 問題レコード（TSV）を1パスで集計し、重要度別の件数（全件）とルール別の件数（上位N件）を
+# "severity|rule<TAB>名前<TAB>件数" 形式で件数の多い順に出力
+# 全体をソートせず、上位N件だけを選択する
+aggregate_issues() {
+    local top="$1"
+    shift
+    LC_ALL=C awk -F'\t' -v top="$top" '
+        function emit(kind, counts, limit,   i, key, best, best_count) {
+            for (i = 0; i < limit; i++) {
+                best = ""
+                best_count = 0
+                for (key in counts) {
+                    if (counts[key] > best_count || (counts[key] == best_count && key < best)) {
+                        best = key
+                        best_count = counts[key]
+                    }
+                }
+                if (best_count == 0) {
+                    break
+                }
+                print kind "\t" best "\t" best_count
+                delete counts[best]
+            }
+        }
+        {
+            if (!($4 in severity)) {
+                severity_kinds++
+            }
+            severity[$4]++
+            rule[$6]++
+        }
+        END {
+            emit("severity", severity, severity_kinds)
+            emit("rule", rule, top)
+        }
+    ' "$@"
+}
+
+# 問題レコード（TSV）のルール名を件数の多い順に上位5件表示
+print_top_rules() {
+    aggregate_issues 5 "$1" | \
+        awk -F'\t' '$1 == "rule" { printf "  %7d %s\n", $3, $2 }'
+}
+
+
+# ツールの実行エラーを記録する（統合レポートと終了コードに反映される）
+# 使い方: record_tool_failure ツール名 メッセージ
+record_tool_failure() {
+    echo "$2" >> "$TOOL_STATE_DIR/$1.failures"
+}
+
+# 標準入力のSHA-256ハッシュ値を出力
+hash_stdin() {
+    if command -v sha256sum &> /dev/null; then
+        sha256sum | cut -d' ' -f1
+    else
+        shasum -a 256 | cut -d' ' -f1
+    fi
+}
+
+# ファイルごとのSHA-256ハッシュ値を "ハッシュ  パス" 形式で出力
+hash_files() {
+    if command -v sha256sum &> /dev/null; then
+        sha256sum "$@"
+    else
+        shasum -a 256 "$@"
+    fi
+}
+
+# ヘッダごとのコンパイルコマンドを compile_commands.json として出力
+# clang-tidy などには -p でこのディレクトリを渡し、コンパイルフラグを共有する
+generate_compile_commands() {
+    local out_dir="$1"
+    shift
+
+    mkdir -p "$out_dir"
+    # パスに引用符・バックスラッシュ・空白が含まれても壊れないよう、
+    # 文字列は JSON エスケープし、コマンドは "arguments" 配列で渡す
+    # -v はエスケープシーケンスを解釈するため、ディレクトリは環境変数で渡す
+    printf '%s\n' "$@" | COMPDB_DIRECTORY="$PROJECT_ROOT" LC_ALL=C awk -v flags="$COMPILE_FLAGS" '
+        BEGIN {
+            for (i = 1; i < 32; i++) {
+                ctrl[sprintf("%c", i)] = sprintf("\\u%04x", i)
+            }
+            nflags = split(flags, flag, " ")
+            print "["
+        }
+        function str(value,    out, c, i) {
+            out = ""
+            for (i = 1; i <= length(value); i++) {
+                c = substr(value, i, 1)
+                if (c == "\\" || c == "\"") {
+                    out = out "\\" c
+                } else if (c in ctrl) {
+                    out = out ctrl[c]
+                } else {
+                    out = out c
+                }
+            }
+            return "\"" out "\""
+        }
+        {
+            args = str("clang++")
+            for (i = 1; i <= nflags; i++) {
+                args = args ", " str(flag[i])
+            }
+            args = args ", " str("-c") ", " str($0)
+            printf "%s  {\n    \"directory\": %s,\n    \"arguments\": [%s],\n    \"file\": %s\n  }", \
+                (NR > 1 ? ",\n" : ""), str(ENVIRON["COMPDB_DIRECTORY"]), args, str($0)
+        }
+        END {
+            print ""
+            print "]"
+        }
+    ' > "$out_dir/compile_commands.json"
+}
+
+# clang-tidy の --export-fixes が出力するYAMLから診断を問題レコード（TSV）として出力
+# FileOffset（バイト位置）は対象ファイルの行頭位置から行・列に変換する
+# 複数の翻訳単位から報告された同じヘッダの同じ診断は1件として扱う
+parse_clang_tidy_fixes() {
+    LC_ALL=C awk '
+        function hex(digits,   i, n) {
+            n = 0
+            for (i = 1; i <= length(digits); i++) {
+                n = n * 16 + index("0123456789abcdef", tolower(substr(digits, i, 1))) - 1
+            }
+            return n
+        }
+        # コードポイントをUTF-8のバイト列に変換する（制御文字はTSVを壊さないよう空白にする）
+        function utf8(code) {
+            if (code < 32 || code == 127) return " "
+            if (code < 128) return sprintf("%c", code)
+            if (code < 2048) return sprintf("%c%c", 192 + int(code / 64), 128 + code % 64)
+            if (code < 65536) {
+                return sprintf("%c%c%c", 224 + int(code / 4096), 128 + int(code / 64) % 64, 128 + code % 64)
+            }
+            return sprintf("%c%c%c%c", 240 + int(code / 262144), 128 + int(code / 4096) % 64, \
+                128 + int(code / 64) % 64, 128 + code % 64)
+        }
+        # YAMLのダブルクォート文字列のエスケープを展開する
+        function unescape(value,   out, c, i, n, width) {
+            out = ""
+            n = length(value)
+            for (i = 1; i <= n; i++) {
+                c = substr(value, i, 1)
+                if (c != "\\" || i == n) {
+                    out = out c
+                    continue
+                }
+                c = substr(value, ++i, 1)
+                width = (c == "x") ? 2 : (c == "u") ? 4 : (c == "U") ? 8 : 0
+                if (width > 0) {
+                    out = out utf8(hex(substr(value, i + 1, width)))
+                    i += width
+                } else if (c == "N") {
+                    out = out utf8(133)
+                } else if (c == "_") {
+                    out = out utf8(160)
+                } else if (index("0abtnvfre", c) > 0) {
+                    out = out " "
+                } else {
+                    out = out c
+                }
+            }
+            return out
+        }
+        function unquote(value) {
+            sub(/^[^:]*:[[:space:]]*/, "", value)
+            if (value ~ /^\047.*\047$/) {
+                value = substr(value, 2, length(value) - 2)
+                gsub(/\047\047/, "\047", value)
+            } else if (value ~ /^".*"$/) {
+                value = unescape(substr(value, 2, length(value) - 2))
+            }
+            gsub(/\t/, " ", value)
+            return value
+        }
+        function load(file,   text, n, pos) {
+            loaded[file] = 1
+            n = 0
+            pos = 0
+            while ((getline text < file) > 0) {
+                starts[file, ++n] = pos
+                pos += length(text) + 1
+            }
+            close(file)
+            line_count[file] = n
+        }
+        function flush(   lo, hi, mid) {
+            if (name != "" && !((name, path, offset) in seen)) {
+                seen[name, path, offset] = 1
+                if (!(path in loaded)) {
+                    load(path)
+                }
+                lo = 1
+                hi = line_count[path]
+                while (lo < hi) {
+                    mid = int((lo + hi + 1) / 2)
+                    if (starts[path, mid] <= offset) lo = mid; else hi = mid - 1
+                }
+                if (hi < 1) {
+                    print path "\t0\t0\t" level "\t" message "\t" name
+                } else {
+                    print path "\t" lo "\t" (offset - starts[path, lo] + 1) "\t" level "\t" message "\t" name
+                }
+            }
+            name = ""; message = ""; path = ""; offset = ""; level = "warning"
+        }
+        /^  - DiagnosticName:/ { flush(); name = $3 }
+        /^      Message:/      { message = unquote($0) }
+        /^      FilePath:/     { path = unquote($0) }
+        /^      FileOffset:/   { offset = $2 + 0 }
+        /^    Level:/          { level = tolower($2) }
+        END { flush() }
+    ' "$@"
+}
+
+# clang系ツールのテキスト出力から診断行を問題レコード（TSV）として出力
+# ルール名のない診断（コンパイルエラーなど）は "unknown" として扱う
+parse_clang_diagnostics() {
+    LC_ALL=C awk -v diag_re="$CLANG_DIAG_RE" '
+        match($0, diag_re) {
+            split(substr($0, 1, RLENGTH - 2), head, ":")
+            severity = head[4]
+            sub(/^ /, "", severity)
+            message = substr($0, RLENGTH + 1)
+            rule = "unknown"
+            if (match(message, / \[[^]]+\]$/)) {
+                rule = substr(message, RSTART + 2, RLENGTH - 3)
+                message = substr(message, 1, RSTART - 1)
+            }
+            gsub(/\t/, " ", message)
+            print head[1] "\t" head[2] "\t" head[3] "\t" severity "\t" message "\t" rule
+        }
+    ' "$@"
+}
+
+# cppcheck のXML（version 2）を1行ずつ読み、位置情報のある問題を
+# 問題レコード（TSV）として出力する
+# DOMを構築しないため、XMLのサイズに関係なく一定のメモリで処理できる
+parse_cppcheck_xml() {
+    LC_ALL=C awk '
+        function attr(line, key,   value) {
+            if (!match(line, " " key "=\"[^\"]*\"")) {
+                return ""
+            }
+            value = substr(line, RSTART + length(key) + 3, RLENGTH - length(key) - 4)
+            gsub(/&lt;/, "<", value)
+            gsub(/&gt;/, ">", value)
+            gsub(/&quot;/, "\"", value)
+            gsub(/&apos;/, "\047", value)
+            gsub(/&amp;/, "\\&", value)
+            return value
+        }
+        /<error / {
+            id = attr($0, "id")
+            severity = attr($0, "severity")
+            msg = attr($0, "msg")
+            gsub(/\t/, " ", msg)
+            pending = ($0 !~ /\/>[[:space:]]*$/)
+            next
+        }
+        /<location / && pending {
+            print attr($0, "file") "\t" attr($0, "line") "\t" attr($0, "column") "\t" severity "\t" msg "\t" id
+            pending = 0
+        }
+        /<\/error>/ { pending = 0 }
+    ' "$1"
+}
+
+# clang-tidy を1回実行し、結果を 出力の接頭辞.txt / .yaml に書き出す
+# 使い方: invoke_clang_tidy 出力の接頭辞 ファイル...
+invoke_clang_tidy() {
+    local base="$1"
+    shift
+    $CLANG_TIDY_CMD "$@" $CLANG_TIDY_OPTIONS \
+        -p "$COMPILE_COMMANDS_DIR" \
+        --export-fixes="$base.yaml" \
+        --config-file=.clang-tidy \
+        --header-filter=".*include/bluestl.*" > "$base.txt" 2>&1
+}
+
+# clang-tidy をチャンク単位で実行する（xargs から並列に呼び出される）
+# キャッシュを使わない場合は、チャンク全体を1回の clang-tidy で解析してプロセス起動のコストを償却する
+# キャッシュを使う場合は1ファイルずつ解析する。clang-tidy は1回の実行に含まれる全TUの診断を
+# まとめて出力するため、診断を生成したTUに結果を帰属させるにはTUごとの実行が必要になる
+run_clang_tidy_chunk() {
+    local status=0
+    local file base key
+
+    if [ "$CLANG_TIDY_PER_FILE" != true ]; then
+        if [ "$VERBOSE" = true ]; then
+            echo "  解析中: $*"
+        fi
+        invoke_clang_tidy "$CLANG_TIDY_WORK_DIR/${1//\//_}" "$@"
+        return
+    fi
+
+    for file in "$@"; do
+        base="$CLANG_TIDY_WORK_DIR/${file//\//_}"
+        key=""
+
+        # プリプロセス済みソースとツール設定をキーに、前回の結果を再利用する
+        # -dD でマクロ定義を、-C でコメント（NOLINT など）をキーに含める
+        if [ -n "$CLANG_TIDY_CACHE_DIR" ]; then
+            key=$( {
+                echo "$CLANG_TIDY_CACHE_SALT"
+                echo "$file"
+                $CACHE_PREPROCESSOR -E -dD -C $COMPILE_FLAGS "$file" 2>&1
+            } | hash_stdin )
+            key="$CLANG_TIDY_CACHE_DIR/clang_tidy_${key}"
+
+            if [ -f "$key.txt" ]; then
+                if [ "$VERBOSE" = true ]; then
+                    echo "  キャッシュ使用: $file"
+                fi
+                cp "$key.txt" "$base.txt"
+                if [ -f "$key.yaml" ]; then
+                    cp "$key.yaml" "$base.yaml"
+                fi
+                continue
+            fi
+        fi
+
+        if [ "$VERBOSE" = true ]; then
+            echo "  解析中: $file"
+        fi
+
+        # 正常終了した結果のみキャッシュする
+        if invoke_clang_tidy "$base" "$file"; then
+            if [ -n "$key" ]; then
+                cp "$base.txt" "$key.txt"
+                if [ -f "$base.yaml" ]; then
+                    cp "$base.yaml" "$key.yaml"
+                fi
+            fi
+        else
+            status=$?
+        fi
+    done
+    return "$status"
+}
+
 cd "$PROJECT_ROOT"
 
 # オプション解析
@@ -26,7 +387,12 @@ ENABLE_CPPCHECK=true
 ENABLE_IWYU=false
 FIX_ISSUES=false
 VERBOSE=false
+USE_CACHE=true
+INCREMENTAL=false
+INCREMENTAL_BASE="origin/main"
 OUTPUT_DIR="static_analysis_reports"
+CHUNK_SIZE=4
+JOBS=$(nproc 2>/dev/null || getconf _NPROCESSORS_ONLN 2>/dev/null || echo 1)
 
 while [[ $# -gt 0 ]]; do
     case $1 in
@@ -50,10 +416,30 @@ while [[ $# -gt 0 ]]; do
             VERBOSE=true
             shift
             ;;
+        --no-cache)
+            USE_CACHE=false
+            shift
+            ;;
+        --incremental)
+            INCREMENTAL=true
+            shift
+            ;;
+        --base)
+            INCREMENTAL_BASE="$2"
+            shift 2
+            ;;
         --output-dir)
             OUTPUT_DIR="$2"
             shift 2
             ;;
+        --jobs|-j)
+            JOBS="$2"
+            shift 2
+            ;;
+        --chunk-size)
+            CHUNK_SIZE="$2"
+            shift 2
+            ;;
         --help|-h)
             echo "使用方法: $0 [オプション]"
             echo ""
@@ -63,7 +449,12 @@ while [[ $# -gt 0 ]]; do
             echo "  --enable-iwyu      include-what-you-useを有効化"
             echo "  --fix              可能な問題を自動修正"
             echo "  --verbose, -v      詳細出力"
+            echo "  --no-cache         解析結果キャッシュを使用しない"
+            echo "  --incremental      ベースブランチからの変更ファイルのみ解析"
+            echo "  --base REF         --incremental の比較対象（デフォルト: origin/main）"
             echo "  --output-dir DIR   レポート出力ディレクトリ（デフォルト: static_analysis_reports）"
+            echo "  --jobs, -j N       全ツール合計の並列実行数（デフォルト: CPUコア数）"
+            echo "  --chunk-size N     clang-tidy 1回あたりの解析ファイル数（デフォルト: 4）"
             echo "  --help, -h         このヘルプを表示"
             exit 0
             ;;
@@ -80,35 +471,140 @@ mkdir -p "$OUTPUT_DIR"
 TIMESTAMP=$(date +"%Y%m%d_%H%M%S")
 
 # 解析対象ファイルの取得
-HEADER_FILES=$(find include/bluestl -name "*.h" -type f)
-SOURCE_FILES=$(find tests -name "*.cpp" -type f 2>/dev/null || true)
-ALL_FILES="$HEADER_FILES $SOURCE_FILES"
+# 一覧には走査したディレクトリも記録し、どれも一覧より新しくなければファイルツリーを再走査せずに再利用する
+# 更新時刻は組み込みの -nt で記録済みのディレクトリだけを比較するため、ディレクトリの読み込みもプロセス起動も発生しない
+# （ファイルやサブディレクトリの追加・削除・改名は、親ディレクトリの更新時刻に反映される）
+FILE_INDEX="$OUTPUT_DIR/.file_index"
+FILE_INDEX_VALID=false
+if [ "$USE_CACHE" = true ] && [ -f "$FILE_INDEX" ]; then
+    FILE_INDEX_VALID=true
+    while read -r kind path; do
+        if [ "$kind" = d ] && { [ ! -d "$path" ] || [ "$path" -nt "$FILE_INDEX" ]; }; then
+            FILE_INDEX_VALID=false
+            break
+        fi
+    done < "$FILE_INDEX"
+fi
+
+if [ "$FILE_INDEX_VALID" = true ]; then
+    HEADER_FILES=$(sed -n 's/^h //p' "$FILE_INDEX")
+    SOURCE_FILES=$(sed -n 's/^s //p' "$FILE_INDEX")
+else
+    HEADER_FILES=$(find include/bluestl -name "*.h" -type f | sort)
+    SOURCE_FILES=$(find tests -name "*.cpp" -type f 2>/dev/null || true)
+    # 走査対象のディレクトリ自体がない場合、後から作られても検出できないため一覧を残さない
+    if [ "$USE_CACHE" = true ] && [ -d include/bluestl ] && [ -d tests ]; then
+        {
+            find include/bluestl tests -type d | sed 's/^/d /'
+            printf 'h %s\n' $HEADER_FILES
+            printf 's %s\n' $SOURCE_FILES
+        } | grep -v '^[hs] $' > "$FILE_INDEX" || true
+    else
+        rm -f "$FILE_INDEX"
+    fi
+fi
 
-if [ -z "$ALL_FILES" ]; then
+if [ -z "$HEADER_FILES$SOURCE_FILES" ]; then
     echo "警告: 解析対象のファイルが見つかりません。"
     exit 1
 fi
 
+# 差分解析: 設定・ツールのバージョンが前回と同じ場合のみ変更ファイルに絞り込む
+CONFIG_HASH_FILE="$OUTPUT_DIR/.config_hash"
+CONFIG_HASH=""
+CHANGED_ONLY=false
+if [ "$INCREMENTAL" = true ]; then
+    CONFIG_HASH=$( {
+        cat .clang-tidy
+        clang-tidy --version 2>/dev/null || true
+        cppcheck --version 2>/dev/null || true
+    } | hash_stdin )
+
+    if [ ! -f "$CONFIG_HASH_FILE" ] || [ "$(cat "$CONFIG_HASH_FILE")" != "$CONFIG_HASH" ]; then
+        echo "ℹ️  設定またはツールのバージョンが変更されたため、全ファイルを解析します。"
+    elif ! CHANGED_FILES=$(git diff --name-only --diff-filter=ACMR "${INCREMENTAL_BASE}...HEAD"); then
+        echo "警告: $INCREMENTAL_BASE との差分を取得できません。全ファイルを解析します。"
+    else
+        echo "ℹ️  差分解析モード: $INCREMENTAL_BASE からの変更ファイルのみ解析します。"
+        CHANGED_ONLY=true
+
+        # 変更されたテストが使用しているヘッダも解析対象に含める
+        CHANGED_SOURCES=$(printf '%s\n' $CHANGED_FILES | grep '^tests/.*\.cpp$' || true)
+        CONSUMED_HEADERS=""
+        if [ -n "$CHANGED_SOURCES" ]; then
+            CONSUMED_HEADERS=$(grep -ho 'bluestl/[A-Za-z0-9_]*\.h' $CHANGED_SOURCES 2>/dev/null | \
+                sed 's|^|include/|' | sort -u || true)
+        fi
+
+        HEADER_FILES=$(printf '%s\n' $HEADER_FILES | \
+            grep -Fx -f <(printf '%s\n' $CHANGED_FILES $CONSUMED_HEADERS) || true)
+        SOURCE_FILES=$(printf '%s\n' $SOURCE_FILES | \
+            grep -Fx -f <(printf '%s\n' $CHANGED_FILES) || true)
+
+        if [ -z "$HEADER_FILES$SOURCE_FILES" ]; then
+            echo "$CONFIG_HASH" > "$CONFIG_HASH_FILE"
+            SUMMARY_REPORT="$OUTPUT_DIR/summary_${TIMESTAMP}.md"
+            {
+                echo "# BlueStl 静的解析統合レポート"
+                echo ""
+                echo "**生成日時**: $(date)"
+                echo "**解析対象**: $INCREMENTAL_BASE からの変更なし"
+                echo "**検出問題数**: 0"
+            } > "$SUMMARY_REPORT"
+            echo "✅ 解析対象の変更がないため、静的解析をスキップしました: $SUMMARY_REPORT"
+            exit 0
+        fi
+    fi
+fi
+
+ALL_FILES="$HEADER_FILES $SOURCE_FILES"
+
 echo "📂 解析対象ファイル数: $(echo $ALL_FILES | wc -w)"
 if [ "$VERBOSE" = true ]; then
     echo "対象ファイル:"
     echo "$ALL_FILES" | tr ' ' '\n' | sed 's/^/  - /'
 fi
 
+# 解析結果キャッシュの準備（自動修正時はファイルが書き換わるため使用しない）
+ANALYSIS_CACHE_DIR=""
+if [ "$USE_CACHE" = true ] && [ "$FIX_ISSUES" = false ]; then
+    ANALYSIS_CACHE_DIR="$OUTPUT_DIR/.cache"
+    mkdir -p "$ANALYSIS_CACHE_DIR"
+fi
+
+# キャッシュキー計算用のプリプロセッサ
+# clang-tidy と同じ #if 分岐（__has_builtin など）を通るよう、clang のフロントエンドに限る
+CACHE_PREPROCESSOR=""
+if command -v clang++ &> /dev/null; then
+    CACHE_PREPROCESSOR="clang++"
+fi
+
+# コンパイルコマンドの生成（各ツールで同じフラグを共有する）
+COMPILE_FLAGS="-std=c++20 -Iinclude"
+export COMPILE_FLAGS
+COMPILE_COMMANDS_DIR="$OUTPUT_DIR/.build"
+if [ -n "$HEADER_FILES" ]; then
+    generate_compile_commands "$COMPILE_COMMANDS_DIR" $HEADER_FILES
+fi
+
 # 1. clang-tidy解析
-if [ "$ENABLE_CLANG_TIDY" = true ]; then
+run_clang_tidy() {
     echo ""
     echo "🔍 clang-tidy解析を実行中..."
     
     if ! command -v clang-tidy &> /dev/null; then
         echo "警告: clang-tidyが見つかりません。スキップします。"
         echo "インストール: sudo apt-get install clang-tidy"
+    elif [ -z "$HEADER_FILES" ]; then
+        echo "ℹ️  解析対象のヘッダがないため、スキップします。"
     else
         CLANG_TIDY_REPORT="$OUTPUT_DIR/clang_tidy_${TIMESTAMP}.txt"
         CLANG_TIDY_OPTIONS=""
         
         if [ "$FIX_ISSUES" = true ]; then
             CLANG_TIDY_OPTIONS="--fix"
+            # 同じヘッダへの修正が競合しないよう、自動修正時は逐次実行する
+            TOOL_JOBS=1
             echo "⚠️  自動修正モードが有効です。ファイルが変更される可能性があります。"
         fi
         
@@ -123,82 +619,193 @@ if [ "$ENABLE_CLANG_TIDY" = true ]; then
         } > "$CLANG_TIDY_REPORT"
         
         # ヘッダファイルのみを解析（テストファイルは除外）
+        # チャンク単位で並列実行し、出力の混在を避けるため結果は元の順序で結合する
+        CLANG_TIDY_WORK_DIR="$OUTPUT_DIR/.clang_tidy_${TIMESTAMP}"
+        mkdir -p "$CLANG_TIDY_WORK_DIR"
+        export CLANG_TIDY_OPTIONS CLANG_TIDY_WORK_DIR COMPILE_COMMANDS_DIR VERBOSE
+        export -f run_clang_tidy_chunk invoke_clang_tidy
+
+        # キャッシュ: ctcache が利用可能ならそちらを使い、なければ内部キャッシュを使う
+        CLANG_TIDY_CMD="clang-tidy"
+        CLANG_TIDY_CACHE_DIR=""
+        CLANG_TIDY_CACHE_SALT=""
+        CLANG_TIDY_PER_FILE=false
+        if [ -n "$ANALYSIS_CACHE_DIR" ]; then
+            if command -v clang-tidy-cache &> /dev/null; then
+                CLANG_TIDY_CMD="clang-tidy-cache clang-tidy"
+                export CTCACHE_DIR="$ANALYSIS_CACHE_DIR/ctcache"
+                export CTCACHE_SAVE_OUTPUT=1
+                CLANG_TIDY_PER_FILE=true
+                echo "キャッシュ: ctcache ($CTCACHE_DIR)"
+            elif [ -n "$CACHE_PREPROCESSOR" ]; then
+                CLANG_TIDY_CACHE_DIR="$ANALYSIS_CACHE_DIR"
+                CLANG_TIDY_PER_FILE=true
+                CLANG_TIDY_CACHE_SALT=$( {
+                    clang-tidy --version
+                    $CACHE_PREPROCESSOR --version
+                    cat .clang-tidy
+                    echo "$CLANG_TIDY_OPTIONS"
+                    echo "$COMPILE_FLAGS"
+                    declare -f run_clang_tidy_chunk
+                    declare -f invoke_clang_tidy
+                    declare -f generate_compile_commands
+                } | hash_stdin )
+                echo "キャッシュ: $CLANG_TIDY_CACHE_DIR"
+            else
+                echo "警告: clang++が見つからないため、clang-tidyのキャッシュを無効化します。"
+            fi
+        fi
+        export CLANG_TIDY_CMD CLANG_TIDY_CACHE_DIR CLANG_TIDY_CACHE_SALT CLANG_TIDY_PER_FILE CACHE_PREPROCESSOR
+        export -f hash_stdin
+
+        if [ "$CLANG_TIDY_PER_FILE" = true ]; then
+            echo "並列実行数: $TOOL_JOBS (キャッシュ利用のため1ファイルずつ解析)"
+        else
+            echo "並列実行数: $TOOL_JOBS (1回あたり最大 $CHUNK_SIZE ファイル)"
+        fi
         CLANG_TIDY_EXIT_CODE=0
+        printf '%s\n' $HEADER_FILES | \
+            xargs -n "$CHUNK_SIZE" -P "$TOOL_JOBS" bash -c 'run_clang_tidy_chunk "$@"' _ || CLANG_TIDY_EXIT_CODE=$?
+        if [ "$CLANG_TIDY_EXIT_CODE" -ne 0 ]; then
+            echo "⚠️  clang-tidyが異常終了したチャンクがあります（xargs終了コード: $CLANG_TIDY_EXIT_CODE）"
+            record_tool_failure clang_tidy \
+                "clang-tidy: 異常終了したチャンクがあります（xargs終了コード: $CLANG_TIDY_EXIT_CODE）"
+        fi
+
+        # 診断の集計は --export-fixes のYAMLから行う
+        # YAMLがない場合（ctcacheのキャッシュヒット時など）はテキスト出力から抽出する
+        CLANG_TIDY_ISSUES_FILE="$TOOL_STATE_DIR/clang_tidy.tsv"
+        # 同じヘッダ内の診断は複数のTUから報告されるため、どちらの経路でも重複を除く
+        CLANG_TIDY_FIXES=()
+        CLANG_TIDY_TEXTS=()
+        : > "$CLANG_TIDY_ISSUES_FILE"
         for file in $HEADER_FILES; do
-            if [ "$VERBOSE" = true ]; then
-                echo "  解析中: $file"
+            base="$CLANG_TIDY_WORK_DIR/${file//\//_}"
+            cat "$base.txt" >> "$CLANG_TIDY_REPORT" 2>/dev/null || true
+            if [ -f "$base.yaml" ]; then
+                CLANG_TIDY_FIXES+=("$base.yaml")
+            elif [ -f "$base.txt" ]; then
+                CLANG_TIDY_TEXTS+=("$base.txt")
             fi
-            
-            clang-tidy "$file" $CLANG_TIDY_OPTIONS \
-                --config-file=.clang-tidy \
-                --header-filter=".*include/bluestl.*" \
-                -- -std=c++20 -Iinclude 2>&1 >> "$CLANG_TIDY_REPORT" || CLANG_TIDY_EXIT_CODE=$?
         done
+        if [ ${#CLANG_TIDY_FIXES[@]} -gt 0 ]; then
+            parse_clang_tidy_fixes "${CLANG_TIDY_FIXES[@]}" >> "$CLANG_TIDY_ISSUES_FILE"
+        fi
+        if [ ${#CLANG_TIDY_TEXTS[@]} -gt 0 ]; then
+            parse_clang_diagnostics "${CLANG_TIDY_TEXTS[@]}" | awk '!seen[$0]++' >> "$CLANG_TIDY_ISSUES_FILE"
+        fi
         
         # 結果サマリー
-        ISSUE_COUNT=$(grep -c "warning:\|error:" "$CLANG_TIDY_REPORT" || echo "0")
+        ISSUE_COUNT=$(count_issues "$CLANG_TIDY_ISSUES_FILE")
         echo "✅ clang-tidy解析完了: $ISSUE_COUNT 件の問題を検出"
         
         if [ "$ISSUE_COUNT" -gt 0 ]; then
             echo "主な問題のサマリー:"
-            grep "warning:\|error:" "$CLANG_TIDY_REPORT" | \
-                sed 's/.*\[\(.*\)\].*/\1/' | \
-                sort | uniq -c | sort -nr | head -5 | \
-                sed 's/^/  /'
+            print_top_rules "$CLANG_TIDY_ISSUES_FILE"
         fi
+        rm -rf "$CLANG_TIDY_WORK_DIR"
     fi
-fi
+}
 
 # 2. cppcheck解析
-if [ "$ENABLE_CPPCHECK" = true ]; then
+run_cppcheck() {
     echo ""
     echo "🔍 cppcheck解析を実行中..."
     
     if ! command -v cppcheck &> /dev/null; then
         echo "警告: cppcheckが見つかりません。スキップします。"
         echo "インストール: sudo apt-get install cppcheck"
+    elif [ -z "$HEADER_FILES" ]; then
+        echo "ℹ️  解析対象のヘッダがないため、スキップします。"
     else
         CPPCHECK_REPORT="$OUTPUT_DIR/cppcheck_${TIMESTAMP}.txt"
         CPPCHECK_XML_REPORT="$OUTPUT_DIR/cppcheck_${TIMESTAMP}.xml"
         
         echo "レポート出力先: $CPPCHECK_REPORT"
         
-        cppcheck \
-            --enable=all \
-            --std=c++20 \
-            --platform=native \
-            --suppress=missingIncludeSystem \
-            --suppress=unusedFunction \
-            --suppress=unmatchedSuppression \
-            --inconclusive \
-            --inline-suppr \
-            --template="[{file}:{line}] ({severity}) {id}: {message}" \
-            --xml \
-            --xml-version=2 \
-            -I include \
-            include/bluestl \
-            2> "$CPPCHECK_XML_REPORT" | tee "$CPPCHECK_REPORT"
+        CPPCHECK_ARGS=(
+            --enable=all
+            --std=c++20
+            --language=c++
+            --platform=native
+            --suppress=missingIncludeSystem
+            --suppress=unusedFunction
+            --suppress=unmatchedSuppression
+            --inconclusive
+            --inline-suppr
+            --template="[{file}:{line}] ({severity}) {id}: {message}"
+            --xml
+            --xml-version=2
+            -I include
+        )
         
-        # XML形式の結果をテキストに変換
-        if command -v xmlstarlet &> /dev/null && [ -f "$CPPCHECK_XML_REPORT" ]; then
-            {
-                echo ""
-                echo "詳細な問題分析:"
-                echo "================"
-                xmlstarlet sel -t -m "//error" \
-                    -v "concat(@file, ':', @line, ' (', @severity, ') ', @id, ': ', @msg)" \
-                    -n "$CPPCHECK_XML_REPORT" 2>/dev/null || echo "XML解析エラー"
-            } >> "$CPPCHECK_REPORT"
+        # cppcheck自身の解析結果を保存し、変更のないファイルの再解析を省く
+        if [ -n "$ANALYSIS_CACHE_DIR" ]; then
+            mkdir -p "$ANALYSIS_CACHE_DIR/cppcheck-build"
+            CPPCHECK_ARGS+=(--cppcheck-build-dir="$ANALYSIS_CACHE_DIR/cppcheck-build")
+        fi
+        
+        # ヘッダは常に明示的に渡す（ディレクトリ指定では .h が展開されず、何も解析されない）
+        # 差分解析時も全体解析時も、対象はclang-tidyと同じヘッダ一覧になる
+        CPPCHECK_ARGS+=($HEADER_FILES)
+        
+        # キャッシュ: ヘッダの名前と内容、ツールのバージョン・オプションが同じなら前回の結果を再利用
+        # ヘッダ単位の再利用は --cppcheck-build-dir が担うため、ここでは実行全体を1つのキーで扱う
+        CPPCHECK_CACHED=""
+        if [ -n "$ANALYSIS_CACHE_DIR" ]; then
+            CPPCHECK_KEY=$( {
+                cppcheck --version
+                printf '%s\n' "${CPPCHECK_ARGS[@]}"
+                hash_files $(find include/bluestl -name "*.h" -type f | sort)
+            } | hash_stdin )
+            CPPCHECK_CACHED="$ANALYSIS_CACHE_DIR/cppcheck_${CPPCHECK_KEY}"
+        fi
+        
+        if [ -n "$CPPCHECK_CACHED" ] && [ -f "$CPPCHECK_CACHED.xml" ] && [ -f "$CPPCHECK_CACHED.txt" ]; then
+            echo "キャッシュ済みの結果を使用します"
+            cp "$CPPCHECK_CACHED.xml" "$CPPCHECK_XML_REPORT"
+            cp "$CPPCHECK_CACHED.txt" "$CPPCHECK_REPORT"
+        else
+            # 出力はパイプを介さずファイルへ直接書き出す（大量出力時のパイプ詰まりを防ぐ）
+            CPPCHECK_EXIT_CODE=0
+            cppcheck "${CPPCHECK_ARGS[@]}" \
+                > "$CPPCHECK_REPORT" 2> "$CPPCHECK_XML_REPORT" || CPPCHECK_EXIT_CODE=$?
+            
+            # --error-exitcode を指定していないため、非0は検出結果ではなく実行自体の失敗を表す
+            # エラーメッセージは標準エラー（XMLの出力先）に書かれるので、XML以外の行を取り出して示す
+            if [ "$CPPCHECK_EXIT_CODE" -ne 0 ]; then
+                CPPCHECK_ERROR=$(grep -v '^[[:space:]]*<' "$CPPCHECK_XML_REPORT" | tail -1)
+                echo "⚠️  cppcheckが終了コード $CPPCHECK_EXIT_CODE で終了しました: ${CPPCHECK_ERROR:-詳細不明}"
+                record_tool_failure cppcheck \
+                    "cppcheck: 終了コード $CPPCHECK_EXIT_CODE で終了しました（${CPPCHECK_ERROR:-詳細不明}）"
+            elif [ -n "$CPPCHECK_CACHED" ]; then
+                cp "$CPPCHECK_XML_REPORT" "$CPPCHECK_CACHED.xml"
+                cp "$CPPCHECK_REPORT" "$CPPCHECK_CACHED.txt"
+            fi
+        fi
+        
+        if [ "$VERBOSE" = true ]; then
+            cat "$CPPCHECK_REPORT"
         fi
         
+        # XML形式の結果をテキストに変換
+        CPPCHECK_ISSUES_FILE="$TOOL_STATE_DIR/cppcheck.tsv"
+        parse_cppcheck_xml "$CPPCHECK_XML_REPORT" > "$CPPCHECK_ISSUES_FILE"
+        {
+            echo ""
+            echo "詳細な問題分析:"
+            echo "================"
+            awk -F'\t' '{ print $1 ":" $2 " (" $4 ") " $6 ": " $5 }' "$CPPCHECK_ISSUES_FILE"
+        } >> "$CPPCHECK_REPORT"
+        
         # 結果サマリー
-        ISSUE_COUNT=$(grep -c "error\|warning\|style\|performance\|portability" "$CPPCHECK_REPORT" || echo "0")
+        ISSUE_COUNT=$(count_issues "$CPPCHECK_ISSUES_FILE")
         echo "✅ cppcheck解析完了: $ISSUE_COUNT 件の問題を検出"
     fi
-fi
+}
 
 # 3. include-what-you-use解析（オプション）
-if [ "$ENABLE_IWYU" = true ]; then
+run_iwyu() {
     echo ""
     echo "🔍 include-what-you-use解析を実行中..."
     
@@ -223,13 +830,101 @@ if [ "$ENABLE_IWYU" = true ]; then
             fi
             
             include-what-you-use \
-                -std=c++20 \
-                -Iinclude \
-                "$file" 2>&1 >> "$IWYU_REPORT" || true
+                $COMPILE_FLAGS \
+                "$file" >> "$IWYU_REPORT" 2>&1 || true
         done
         
         echo "✅ include-what-you-use解析完了"
     fi
+}
+
+# 各ツールは互いに独立しているため並列に実行する
+# 出力の混在を避けるため、ツールごとのログに書き出してから順番に表示する
+TOOL_STATE_DIR="$OUTPUT_DIR/.tools_${TIMESTAMP}"
+mkdir -p "$TOOL_STATE_DIR"
+
+TOOLS=()
+if [ "$ENABLE_CLANG_TIDY" = true ]; then
+    TOOLS+=(clang_tidy)
+fi
+if [ "$ENABLE_CPPCHECK" = true ]; then
+    TOOLS+=(cppcheck)
+fi
+if [ "$ENABLE_IWYU" = true ]; then
+    TOOLS+=(iwyu)
+fi
+
+TOOL_STATUS=0
+TOOL_JOBS="$JOBS"
+if [ "$FIX_ISSUES" = true ] || [ ${#TOOLS[@]} -le 1 ]; then
+    # 自動修正中のファイルを他のツールが読まないよう、逐次実行する
+    for tool in "${TOOLS[@]}"; do
+        "run_$tool"
+    done
+else
+    # 並列実行数を同時に動くツールで分け合う
+    # cppcheck と IWYU は1プロセスで動くため1つ分、残りを xargs で並列化するツールに割り当てる
+    PARALLEL_TOOL_COUNT=0
+    for tool in "${TOOLS[@]}"; do
+        case "$tool" in
+            clang_tidy) PARALLEL_TOOL_COUNT=$((PARALLEL_TOOL_COUNT + 1)) ;;
+        esac
+    done
+    if [ "$PARALLEL_TOOL_COUNT" -gt 0 ]; then
+        TOOL_JOBS=$(( (JOBS - (${#TOOLS[@]} - PARALLEL_TOOL_COUNT)) / PARALLEL_TOOL_COUNT ))
+        if [ "$TOOL_JOBS" -lt 1 ]; then
+            TOOL_JOBS=1
+        fi
+    fi
+
+    echo ""
+    echo "⏳ ${TOOLS[*]} を並列実行中..."
+    echo "   各ツールの出力は、そのツールの完了後にまとめて表示します。"
+    TOOL_PIDS=()
+    for tool in "${TOOLS[@]}"; do
+        "run_$tool" > "$TOOL_STATE_DIR/$tool.log" 2>&1 &
+        TOOL_PIDS+=($!)
+    done
+
+    # 完了したツールから順にログを表示する
+    REMAINING_TOOLS=("${!TOOLS[@]}")
+    while [ ${#REMAINING_TOOLS[@]} -gt 0 ]; do
+        PENDING_TOOLS=()
+        for i in "${REMAINING_TOOLS[@]}"; do
+            if kill -0 "${TOOL_PIDS[$i]}" 2>/dev/null; then
+                PENDING_TOOLS+=("$i")
+                continue
+            fi
+            wait "${TOOL_PIDS[$i]}" || TOOL_STATUS=$?
+            cat "$TOOL_STATE_DIR/${TOOLS[$i]}.log"
+        done
+        REMAINING_TOOLS=("${PENDING_TOOLS[@]}")
+        if [ ${#REMAINING_TOOLS[@]} -gt 0 ]; then
+            sleep 1
+        fi
+    done
+fi
+
+CLANG_TIDY_ISSUES=$(count_issues "$TOOL_STATE_DIR/clang_tidy.tsv")
+CPPCHECK_ISSUES=$(count_issues "$TOOL_STATE_DIR/cppcheck.tsv")
+
+# 全ツールの問題レコードをまとめて集計
+ISSUE_FILES=()
+for tool in "${TOOLS[@]}"; do
+    if [ -f "$TOOL_STATE_DIR/$tool.tsv" ]; then
+        ISSUE_FILES+=("$TOOL_STATE_DIR/$tool.tsv")
+    fi
+done
+ISSUE_AGGREGATE=""
+if [ ${#ISSUE_FILES[@]} -gt 0 ]; then
+    ISSUE_AGGREGATE=$(aggregate_issues 5 "${ISSUE_FILES[@]}")
+fi
+TOOL_FAILURES=$(cat "$TOOL_STATE_DIR"/*.failures 2>/dev/null || true)
+rm -rf "$TOOL_STATE_DIR"
+
+if [ "$TOOL_STATUS" -ne 0 ]; then
+    echo "エラー: 静的解析ツールの実行に失敗しました（終了コード: $TOOL_STATUS）"
+    exit "$TOOL_STATUS"
 fi
 
 # 4. 統合レポートの生成
@@ -247,17 +942,15 @@ SUMMARY_REPORT="$OUTPUT_DIR/summary_${TIMESTAMP}.md"
     echo ""
     
     if [ "$ENABLE_CLANG_TIDY" = true ] && [ -f "$OUTPUT_DIR/clang_tidy_${TIMESTAMP}.txt" ]; then
-        CLANG_TIDY_ISSUES=$(grep -c "warning:\|error:" "$OUTPUT_DIR/clang_tidy_${TIMESTAMP}.txt" || echo "0")
         echo "## clang-tidy結果"
-        echo "- **検出問題数**: $CLANG_TIDY_ISSUES"
+        echo "- **検出問題数**: ${CLANG_TIDY_ISSUES:-0}"
         echo "- **詳細レポート**: [clang_tidy_${TIMESTAMP}.txt](./clang_tidy_${TIMESTAMP}.txt)"
         echo ""
     fi
     
     if [ "$ENABLE_CPPCHECK" = true ] && [ -f "$OUTPUT_DIR/cppcheck_${TIMESTAMP}.txt" ]; then
-        CPPCHECK_ISSUES=$(grep -c "error\|warning\|style\|performance\|portability" "$OUTPUT_DIR/cppcheck_${TIMESTAMP}.txt" || echo "0")
         echo "## cppcheck結果"
-        echo "- **検出問題数**: $CPPCHECK_ISSUES"
+        echo "- **検出問題数**: ${CPPCHECK_ISSUES:-0}"
         echo "- **詳細レポート**: [cppcheck_${TIMESTAMP}.txt](./cppcheck_${TIMESTAMP}.txt)"
         echo ""
     fi
@@ -268,6 +961,21 @@ SUMMARY_REPORT="$OUTPUT_DIR/summary_${TIMESTAMP}.md"
         echo ""
     fi
     
+    if [ -n "$ISSUE_AGGREGATE" ]; then
+        echo "## 重要度別の検出問題数"
+        echo "$ISSUE_AGGREGATE" | awk -F'\t' '$1 == "severity" { print "- **" $2 "**: " $3 }'
+        echo ""
+        echo "## 主な問題（上位5件）"
+        echo "$ISSUE_AGGREGATE" | awk -F'\t' '$1 == "rule" { print "- `" $2 "`: " $3 " 件" }'
+        echo ""
+    fi
+    
+    if [ -n "$TOOL_FAILURES" ]; then
+        echo "## 実行エラー"
+        echo "$TOOL_FAILURES" | sed 's/^/- /'
+        echo ""
+    fi
+    
     echo "## 推奨アクション"
     echo "1. 高優先度の警告・エラーを確認し修正"
     echo "2. パフォーマンス関連の指摘を検討"
@@ -313,4 +1021,16 @@ if [ "${CI:-false}" = "true" ]; then
     fi
 fi
 
+if [ -n "$TOOL_FAILURES" ]; then
+    echo ""
+    echo "エラー: 一部の解析が正常に完了しませんでした。"
+    echo "$TOOL_FAILURES" | sed 's/^/  /'
+    exit 1
+fi
+
+# 差分解析用に今回の設定ハッシュを保存
+if [ -n "$CONFIG_HASH" ]; then
+    echo "$CONFIG_HASH" > "$CONFIG_HASH_FILE"
+fi
+
 echo "静的解析処理が完了しました。"
\ No newline at end of file